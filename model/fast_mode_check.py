@@ -0,0 +1,144 @@
+"""
+Verificación del modo rápido (WindASCE705(fast=True)).
+
+- Comprueba los errores máximos documentados en FastLookup sobre todo el dominio
+  de entrada (barrido denso + puntos de quiebre + valores fuera de malla).
+- Mide rendimiento (cálculos/s) y memoria frente al modo exacto.
+
+Uso: python -m model.fast_mode_check
+"""
+import time
+import tracemalloc
+
+import numpy as np
+
+from model.wind_logic import (
+    EXPOSURE_COEFFS, CP_ROOF_WW, FastLookup, WindASCE705,
+    cp_leeward_wall_exact, cp_roof_exact, get_fast_lookup,
+)
+
+
+def _with_breakpoints(values, breakpoints):
+    return np.unique(np.concatenate([values, np.asarray(breakpoints, dtype=np.float64)]))
+
+
+def check_error_bounds(n_samples=20000, seed=0):
+    """Retorna el error máximo observado de Cp; lanza AssertionError si se excede el límite."""
+    lk = get_fast_lookup()
+    rng = np.random.default_rng(seed)
+
+    # Cp techo: theta en [0, 60], h/L en [0, 2]
+    n = int(np.sqrt(n_samples))
+    thetas = _with_breakpoints(np.concatenate([np.linspace(0.0, 60.0, n), rng.uniform(0.0, 60.0, n)]),
+                               [9.999, 10.0] + list(CP_ROOF_WW.keys()))
+    ratios = _with_breakpoints(np.concatenate([np.linspace(0.0, 2.0, n), rng.uniform(0.0, 2.0, n)]),
+                               [0.25, 0.5, 1.0])
+    cp_err = 0.0
+    for a in thetas:
+        for r in ratios:
+            fast = lk.cp_roof(float(a), float(r))
+            exact = cp_roof_exact(a, r)
+            cp_err = max(cp_err, max(abs(f - e) for f, e in zip(fast, exact)))
+
+    # Cp pared sotavento: L/B en [0.1, 8]
+    lb = _with_breakpoints(np.linspace(0.1, 8.0, n_samples), [1.0, 2.0, 4.0])
+    exact = np.array([cp_leeward_wall_exact(v) for v in lb])
+    cp_err = max(cp_err, float(np.max(np.abs(lk.cp_leeward_wall(lb) - exact))))
+    if cp_err > FastLookup.CP_MAX_ABS_ERROR:
+        raise AssertionError(f"Cp: error absoluto {cp_err:.3e} > {FastLookup.CP_MAX_ABS_ERROR:g}")
+
+    return {'cp_max_abs_error': cp_err}
+
+
+def _random_inputs(n, seed=1):
+    rng = np.random.default_rng(seed)
+    exposures = list(EXPOSURE_COEFFS)
+    return [{
+        'V': rng.uniform(100.0, 300.0),
+        'exposure': exposures[rng.integers(len(exposures))],
+        'I': rng.choice([0.87, 1.0, 1.15]),
+        'h': rng.uniform(2.0, 60.0),
+        'L': rng.uniform(5.0, 100.0),
+        'B': rng.uniform(5.0, 100.0),
+        'theta': rng.uniform(0.0, 50.0),
+        'enclosure': 'Cerrado',
+    } for _ in range(n)]
+
+
+def check_pressures(inputs):
+    """Error máximo |dp| / qh del modo rápido vs exacto en calculate(); lanza AssertionError si excede P_MAX_REL_ERROR."""
+    exact_model, fast_model = WindASCE705(), WindASCE705(fast=True)
+    worst = 0.0
+    for data in inputs:
+        r_e, r_f = exact_model.calculate(data), fast_model.calculate(data)
+        qh = r_e['meta']['qh']
+        for key in ('trans', 'long'):
+            for row_e, row_f in zip(r_e[key], r_f[key]):
+                for p in ('p_pos', 'p_neg'):
+                    worst = max(worst, abs(row_f[p] - row_e[p]) / qh)
+    if worst > FastLookup.P_MAX_REL_ERROR:
+        raise AssertionError(f"p: error relativo a qh {worst:.3e} > {FastLookup.P_MAX_REL_ERROR:g}")
+    return worst
+
+
+def _timed(fn, n_repeat):
+    t0 = time.perf_counter()
+    for _ in range(n_repeat):
+        fn()
+    return n_repeat / (time.perf_counter() - t0)
+
+
+def benchmark(inputs, n_cp=20000, seed=2):
+    """Rendimiento de calculate() y de Cp de techo; memoria residente de tablas y pico por llamada."""
+    out = {}
+    for label, model in (('exact', WindASCE705()), ('fast', WindASCE705(fast=True))):
+        t0 = time.perf_counter()
+        for data in inputs:
+            model.calculate(data)
+        out[f'{label}_calc_per_s'] = len(inputs) / (time.perf_counter() - t0)
+
+        tracemalloc.start()
+        model.calculate(inputs[0])
+        out[f'{label}_calc_peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    # Cp de techo (la única parte tabulada), mismas entradas escalares en ambos caminos
+    lk = get_fast_lookup()
+    rng = np.random.default_rng(seed)
+    pts = list(zip(rng.uniform(10.0, 45.0, n_cp).tolist(), rng.uniform(0.0, 1.5, n_cp).tolist()))
+    t0 = time.perf_counter()
+    for a, r in pts:
+        cp_roof_exact(a, r)
+    out['exact_cp_per_s'] = n_cp / (time.perf_counter() - t0)
+    t0 = time.perf_counter()
+    for a, r in pts:
+        lk.cp_roof(a, r)
+    out['fast_cp_per_s'] = n_cp / (time.perf_counter() - t0)
+
+    # El modo exacto no tiene tablas: esto es un costo de memoria del modo rápido
+    out['table_bytes'] = lk.nbytes
+    return out
+
+
+def main():
+    errors = check_error_bounds()
+    inputs = _random_inputs(2000)
+    p_err = check_pressures(inputs)
+    bench = benchmark(inputs)
+
+    print("== Errores máximos (observado / garantizado) ==")
+    print(f"Cp  (absoluto): {errors['cp_max_abs_error']:.3e} / {FastLookup.CP_MAX_ABS_ERROR:.0e}")
+    print(f"p   (relativo a qh): {p_err:.3e} / {FastLookup.P_MAX_REL_ERROR:.0e}")
+    print("Kz  exacto en ambos modos (sin tabla)")
+    print("== Rendimiento ==")
+    print(f"calculate(): exacto {bench['exact_calc_per_s']:.0f}/s, rápido {bench['fast_calc_per_s']:.0f}/s "
+          f"(x{bench['fast_calc_per_s'] / bench['exact_calc_per_s']:.2f})")
+    print(f"Cp techo: exacto {bench['exact_cp_per_s']:.0f}/s, rápido {bench['fast_cp_per_s']:.0f}/s "
+          f"(x{bench['fast_cp_per_s'] / bench['exact_cp_per_s']:.1f})")
+    print("== Memoria (costo del modo rápido, sin ganancia) ==")
+    print(f"Pico por calculate(): exacto {bench['exact_calc_peak_bytes']} B, rápido {bench['fast_calc_peak_bytes']} B")
+    print(f"Tablas residentes (solo modo rápido): {bench['table_bytes']} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,177 @@
 import numpy as np
 
+# --- Coeficientes de Terreno (Tabla 6-2) ---
+# alpha y zg para usar en la fórmula de Kz
+EXPOSURE_COEFFS = {
+    'B': (7.0, 365.76),  # zg = 1200 ft
+    'C': (9.5, 274.32),  # zg = 900 ft
+    'D': (11.5, 213.36)  # zg = 700 ft
+}
+
+# --- Cp de techo (Fig 6-6): {theta: {h/L: Cp}} ---
+CP_ROOF_WW = {
+    10: {-1: -0.7, 0.25: -0.7, 0.5: -0.9, 1.0: -1.3},
+    15: {-1: -0.5, 0.25: -0.5, 0.5: -0.7, 1.0: -1.0},
+    20: {-1: -0.3, 0.25: -0.3, 0.5: -0.4, 1.0: -0.7},
+    25: {-1: -0.2, 0.25: -0.2, 0.5: -0.3, 1.0: -0.5},
+    30: {-1: -0.2, 0.25: -0.2, 0.5: -0.2, 1.0: -0.3},
+    35: {-1:  0.0, 0.25:  0.0, 0.5: -0.2, 1.0: -0.2},
+    45: {-1:  0.0, 0.25:  0.0, 0.5:  0.0, 1.0:  0.0},
+}
+CP_ROOF_LW = {
+    10: {-1: -0.3, 0.25: -0.3, 0.5: -0.5, 1.0: -0.7},
+    15: {-1: -0.5, 0.25: -0.5, 0.5: -0.5, 1.0: -0.6},
+    20: {-1: -0.6, 0.25: -0.6, 0.5: -0.6, 1.0: -0.6}
+}
+
+
+def kz_exact(z_cal, exposure):
+    """
+    Calcula Kz según la Nota 1 y 2 de la Tabla 6-3.
+    Formula: Kz = 2.01 * (z / zg)^(2/alpha)
+    Restricción: Para z < 4.6m (15 ft), usar Kz calculado a 4.6m.
+    """
+    alpha, zg = EXPOSURE_COEFFS[exposure]
+    z_eff = max(z_cal, 4.6)
+    return 2.01 * ((z_eff / zg) ** (2.0 / alpha))
+
+
+def cp_roof_exact(angle, h_L_ratio):
+    """Interpolación bilineal (theta, h/L) de Cp en Fig 6-6. Retorna (Cp pared, Cp techo ww, Cp techo lw)."""
+    if angle < 10: return 0.8, -0.9, -0.5
+
+    def interp_1d(val, x_list, y_list): return np.interp(val, x_list, y_list)
+
+    angles_sorted = sorted(CP_ROOF_WW.keys())
+    cp_ww, cp_lw = [], []
+    for a in angles_sorted:
+        r_ww, r_lw = CP_ROOF_WW[a], CP_ROOF_LW.get(a, CP_ROOF_LW[20])
+        cp_ww.append(interp_1d(h_L_ratio, sorted(r_ww.keys()), [r_ww[k] for k in sorted(r_ww.keys())]))
+        cp_lw.append(interp_1d(h_L_ratio, sorted(r_lw.keys()), [r_lw[k] for k in sorted(r_lw.keys())]))
+
+    return 0.8, interp_1d(angle, angles_sorted, cp_ww), interp_1d(angle, angles_sorted, cp_lw)
+
+
+def cp_leeward_wall_exact(ratio_LB):
+    """Cp de pared sotavento según L/B (Fig 6-6)."""
+    return -0.5 if ratio_LB <= 1 else (-0.2 if ratio_LB >= 4 else np.interp(ratio_LB, [1, 2, 4], [-0.5, -0.3, -0.2]))
+
+
+class FastLookup:
+    """
+    Tablas densas precalculadas (float32) para el modo rápido de screening.
+
+    Kz no se tabula: la ley de potencia exacta es más barata que una consulta a
+    tabla, por lo que el modo rápido usa kz_exact igual que el modo exacto.
+
+    Dominio y error máximo garantizado frente al cálculo exacto:
+    - Cp techo: malla (theta, h/L) sobre [10°, 45°] x [0.25, 1.0]. Fuera de ese
+      rango el cálculo exacto ya es constante (np.interp satura), así que se satura
+      igual. theta < 10° usa los valores fijos del caso exacto.
+      Error absoluto <= CP_MAX_ABS_ERROR.
+    - Cp pared sotavento: malla en L/B sobre [1, 4], saturada fuera.
+      Error absoluto <= CP_MAX_ABS_ERROR.
+    - Presiones p: con Kz exacto solo Cp introduce error, y cada término afectado
+      es q * G * Cp con q <= qh y G < 1. Error |dp| / qh <= P_MAX_REL_ERROR.
+
+    Justificación de CP_MAX_ABS_ERROR: los puntos de quiebre de la Fig 6-6 son
+    nodos de las mallas, y dentro de cada celda de la figura Cp es bilineal en
+    (theta, h/L) y lineal en L/B. La interpolación en una submalla alineada
+    reproduce una función bilineal sin error, así que solo queda el redondeo de
+    los nodos a float32: |Cp| <= 1.3 y 1.3 * 2^-24 ~ 8e-8, muy por debajo de 1e-6.
+    Ver model/fast_mode_check.py para la verificación sobre todo el dominio.
+
+    Una entrada NaN produce Cp NaN, igual que en el cálculo exacto.
+    """
+    THETA_MIN, THETA_MAX, THETA_STEP = 10.0, 45.0, 0.5
+    HL_MIN, HL_MAX, HL_STEP = 0.25, 1.0, 0.01
+    LB_MIN, LB_MAX, LB_STEP = 1.0, 4.0, 0.01
+    CP_MAX_ABS_ERROR = 1e-6
+    P_MAX_REL_ERROR = CP_MAX_ABS_ERROR
+
+    def __init__(self):
+        thetas, self.theta_step = self._grid(self.THETA_MIN, self.THETA_MAX, self.THETA_STEP)
+        ratios, self.hl_step = self._grid(self.HL_MIN, self.HL_MAX, self.HL_STEP)
+        self.cp_ww_table = np.empty((thetas.size, ratios.size), dtype=np.float32)
+        self.cp_lw_table = np.empty((thetas.size, ratios.size), dtype=np.float32)
+        for i, a in enumerate(thetas):
+            for j, r in enumerate(ratios):
+                _, self.cp_ww_table[i, j], self.cp_lw_table[i, j] = cp_roof_exact(a, r)
+
+        self.lb_grid, self.lb_step = self._grid(self.LB_MIN, self.LB_MAX, self.LB_STEP)
+        self.cp_wall_table = np.array([cp_leeward_wall_exact(r) for r in self.lb_grid], dtype=np.float32)
+
+    @staticmethod
+    def _grid(v_min, v_max, step):
+        """Malla uniforme que incluye ambos extremos; retorna (nodos, paso real)."""
+        n = int(round((v_max - v_min) / step)) + 1
+        return np.linspace(v_min, v_max, n), (v_max - v_min) / (n - 1)
+
+    @property
+    def nbytes(self):
+        """Memoria ocupada por las tablas float32 (bytes)."""
+        return self.cp_ww_table.nbytes + self.cp_lw_table.nbytes + self.cp_wall_table.nbytes
+
+    @staticmethod
+    def _cell(val, v_min, step, n):
+        """Índice de celda y fracción local en una malla uniforme (saturada en los bordes).
+        Para NaN retorna la celda 0 con fracción NaN, de modo que el resultado sea NaN."""
+        if isinstance(val, (int, float)):
+            if val != val: return 0, val
+            pos = min(max((val - v_min) / step, 0.0), n - 1.0)
+            idx = min(int(pos), n - 2)
+            return idx, pos - idx
+        pos = np.clip((np.asarray(val, dtype=np.float64) - v_min) / step, 0.0, n - 1)
+        idx = np.minimum(np.nan_to_num(pos).astype(np.intp), n - 2)
+        return idx, pos - idx
+
+    @staticmethod
+    def _lerp(table, i, t):
+        if isinstance(i, int):
+            return table.item(i) * (1.0 - t) + table.item(i + 1) * t
+        return table[i] * (1.0 - t) + table[i + 1] * t
+
+    def cp_roof(self, angle, h_L_ratio):
+        """Equivalente rápido de cp_roof_exact (solo escalares)."""
+        if angle < 10: return 0.8, -0.9, -0.5
+        n_t, n_r = self.cp_ww_table.shape
+        i, ft = self._cell(float(angle), self.THETA_MIN, self.theta_step, n_t)
+        j, fr = self._cell(float(h_L_ratio), self.HL_MIN, self.hl_step, n_r)
+
+        def bilinear(tbl):
+            return (self._lerp(tbl[i], j, fr) * (1.0 - ft) + self._lerp(tbl[i + 1], j, fr) * ft)
+
+        return 0.8, bilinear(self.cp_ww_table), bilinear(self.cp_lw_table)
+
+    def cp_leeward_wall(self, ratio_LB):
+        """Equivalente rápido de cp_leeward_wall_exact; acepta escalar o arreglo."""
+        return self._lerp(self.cp_wall_table, *self._cell(ratio_LB, self.LB_MIN, self.lb_step, self.cp_wall_table.size))
+
+
+_FAST_LOOKUP = None
+
+
+def get_fast_lookup():
+    """Instancia compartida (perezosa) de FastLookup."""
+    global _FAST_LOOKUP
+    if _FAST_LOOKUP is None:
+        _FAST_LOOKUP = FastLookup()
+    return _FAST_LOOKUP
+
+
 class WindASCE705:
     """
     Lógica de cálculo ASCE 7-05 (MWFRS).
     - Coeficientes Kz según Tabla 6-3 (Formula analítica).
     - Interpolación Bilineal para Cp (Fig 6-6).
     - Soporte para alturas h > 4.6m con pasos detallados.
+    - fast=True: modo rápido de screening con tablas float32 precalculadas
+      (error máximo documentado en FastLookup).
     """
-    def __init__(self):
+    def __init__(self, fast=False):
         self.results = {}
+        self.fast = fast
+        self.lookup = get_fast_lookup() if fast else None
 
     def calculate(self, data):
         try:
@@ -34,27 +197,23 @@ class WindASCE705:
             else: gcpi = 0.18
 
             # --- 2. Coeficientes de Terreno (Tabla 6-2) ---
-            # alpha y zg para usar en la fórmula de Kz
-            coeffs = {
-                'B': (7.0, 365.76),  # zg = 1200 ft
-                'C': (9.5, 274.32),  # zg = 900 ft
-                'D': (11.5, 213.36)  # zg = 700 ft
-            }
-            alpha, zg = coeffs[exposure]
+            if exposure not in EXPOSURE_COEFFS: raise KeyError(exposure)
 
-            def get_Kz(z_cal):
-                """
-                Calcula Kz según la Nota 1 y 2 de la Tabla 6-3.
-                Formula: Kz = 2.01 * (z / zg)^(2/alpha)
-                Restricción: Para z < 4.6m (15 ft), usar Kz calculado a 4.6m.
-                """
-                z_eff = max(z_cal, 4.6) 
-                return 2.01 * ((z_eff / zg) ** (2.0 / alpha))
+            # --- GENERACIÓN DE ALTURAS Z PARA PARED BARLOVENTO ---
+            # Pasos estándar de Tabla 6-3 en metros:
+            # 15'->4.6m, 20'->6.1m, 25'->7.6m, 30'->9.1m, 40'->12.2m, 
+            # 50'->15.2m, 60'->18.3m, 70'->21.3m, 80'->24.4m, 90'->27.4m, 100'->30.5m
+            steps_table = [4.6, 6.1, 7.6, 9.1, 12.2, 15.2, 18.3, 21.3, 24.4, 27.4, 30.5]
+            
+            # Filtramos las alturas menores a h y agregamos h al final
+            z_list = [z for z in steps_table if z < h] + [h]
+            # Kz exacto en ambos modos (más rápido que cualquier tabla)
+            kz_list = [kz_exact(z, exposure) for z in z_list]
 
             # --- 3. Presión Velocidad (qz) ---
             const_metric = 0.613
             # [cite_start]Kh: Se calcula con Kz evaluado a la altura media del techo h [cite: 1]
-            Kz_h = get_Kz(h)
+            Kz_h = kz_list[-1]
             qh = const_metric * Kz_h * Kzt * Kd * (V_ms**2) * I
 
             calc_details = {
@@ -64,33 +223,8 @@ class WindASCE705:
             }
 
             # --- 4. Interpolación Fig 6-6 (Cp) ---
-            def get_cp_bilinear(angle, h_L_ratio):
-                if angle < 10: return 0.8, -0.9, -0.5 
-
-                ww_data = {
-                    10: {-1: -0.7, 0.25: -0.7, 0.5: -0.9, 1.0: -1.3},
-                    15: {-1: -0.5, 0.25: -0.5, 0.5: -0.7, 1.0: -1.0},
-                    20: {-1: -0.3, 0.25: -0.3, 0.5: -0.4, 1.0: -0.7},
-                    25: {-1: -0.2, 0.25: -0.2, 0.5: -0.3, 1.0: -0.5},
-                    30: {-1: -0.2, 0.25: -0.2, 0.5: -0.2, 1.0: -0.3},
-                    35: {-1:  0.0, 0.25:  0.0, 0.5: -0.2, 1.0: -0.2},
-                    45: {-1:  0.0, 0.25:  0.0, 0.5:  0.0, 1.0:  0.0},
-                }
-                lw_data = {
-                    10: {-1: -0.3, 0.25: -0.3, 0.5: -0.5, 1.0: -0.7},
-                    15: {-1: -0.5, 0.25: -0.5, 0.5: -0.5, 1.0: -0.6},
-                    20: {-1: -0.6, 0.25: -0.6, 0.5: -0.6, 1.0: -0.6}
-                }
-                def interp_1d(val, x_list, y_list): return np.interp(val, x_list, y_list)
-
-                angles_sorted = sorted(ww_data.keys())
-                cp_ww, cp_lw = [], []
-                for a in angles_sorted:
-                    r_ww, r_lw = ww_data[a], lw_data.get(a, lw_data[20])
-                    cp_ww.append(interp_1d(h_L_ratio, sorted(r_ww.keys()), [r_ww[k] for k in sorted(r_ww.keys())]))
-                    cp_lw.append(interp_1d(h_L_ratio, sorted(r_lw.keys()), [r_lw[k] for k in sorted(r_lw.keys())]))
-
-                return 0.8, interp_1d(angle, angles_sorted, cp_ww), interp_1d(angle, angles_sorted, cp_lw)
+            get_cp_bilinear = self.lookup.cp_roof if self.fast else cp_roof_exact
+            get_cp_lw_wall = self.lookup.cp_leeward_wall if self.fast else cp_leeward_wall_exact
 
             # --- 5. Análisis ---
             def analyze_case(L_bldg, B_bldg, is_transverse):
@@ -106,18 +240,8 @@ class WindASCE705:
                     cp_w, cp_r_ww, cp_r_lw = get_cp_bilinear(0, h_L)
                     tag = f"Paral. Caballete (Simulado <10°)"
 
-                # --- GENERACIÓN DE ALTURAS Z PARA PARED BARLOVENTO ---
-                # Pasos estándar de Tabla 6-3 en metros:
-                # 15'->4.6m, 20'->6.1m, 25'->7.6m, 30'->9.1m, 40'->12.2m, 
-                # 50'->15.2m, 60'->18.3m, 70'->21.3m, 80'->24.4m, 90'->27.4m, 100'->30.5m
-                steps_table = [4.6, 6.1, 7.6, 9.1, 12.2, 15.2, 18.3, 21.3, 24.4, 27.4, 30.5]
-                
-                # Filtramos las alturas menores a h y agregamos h al final
-                z_list = [z for z in steps_table if z < h] + [h]
-                
                 # Pared Barlovento (Variable con z)
-                for z in z_list:
-                    kz = get_Kz(z)
+                for z, kz in zip(z_list, kz_list):
                     qz = const_metric * kz * Kzt * Kd * (V_ms**2) * I
                     
                     rows.append({
@@ -132,7 +256,7 @@ class WindASCE705:
 
                 # [cite_start]Pared Sotavento (Constante a altura media h) [cite: 1]
                 ratio_LB = L_wind / B_wind
-                cp_lw_wall = -0.5 if ratio_LB <= 1 else (-0.2 if ratio_LB >= 4 else np.interp(ratio_LB, [1, 2, 4], [-0.5, -0.3, -0.2]))
+                cp_lw_wall = get_cp_lw_wall(ratio_LB)
                 
                 rows.append({'elem': 'Pared Sotavento', 'z': 'All (h)', 'q': qh, 'G': G, 'Cp': cp_lw_wall, 'p_pos': qh*G*cp_lw_wall - qh*gcpi, 'p_neg': qh*G*cp_lw_wall - qh*(-gcpi)})
                 
@@ -146,7 +270,7 @@ class WindASCE705:
             res_l, tag_l = analyze_case(L_geom, B_geom, False)
 
             self.results = {
-                'meta': {'V': V_kmh, 'exposure': exposure, 'I': I, 'h': h, 'theta': theta, 'qh': qh, 'Kd': Kd, 'G': G, 'gcpi': gcpi},
+                'meta': {'V': V_kmh, 'exposure': exposure, 'I': I, 'h': h, 'theta': theta, 'qh': qh, 'Kd': Kd, 'G': G, 'gcpi': gcpi, 'fast': self.fast},
                 'details': calc_details,
                 'trans': res_t, 'tag_trans': tag_t, 'long': res_l, 'tag_long': tag_l
             }
@@ -165,6 +289,11 @@ class WindASCE705:
         STYLE_TD_LEFT = STYLE_TD + ' text-align: left;'
         STYLE_TD_BOLD = STYLE_TD + ' font-weight: bold;'
 
+        fast_note = ''
+        if m.get('fast'):
+            fast_note = (f'<p style="color: #c0392b; font-size: 9pt;">Modo rápido (screening): tablas precalculadas de Cp, '
+                         f'error absoluto Cp &le; {FastLookup.CP_MAX_ABS_ERROR:g}, error p/qh &le; {FastLookup.P_MAX_REL_ERROR:g}.</p>')
+
         html = f"""
         <html>
         <head>
@@ -178,6 +307,7 @@ class WindASCE705:
         <body>
             <h1>Memoria de Cálculo ASCE 7-05</h1>
             <p style="color: #7f8c8d; font-size: 9pt;">Método Analítico (MWFRS) - Capítulo 6</p>
+            {fast_note}
             
             <h2>1. Parámetros de Diseño</h2>
             <table border="1" cellspacing="0" cellpadding="0" style="border-collapse:collapse; width:100%; border:1px solid #bdc3c7;">